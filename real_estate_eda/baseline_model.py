@@ -3,15 +3,20 @@ from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
 import pandas as pd
 import numpy as np
+from real_estate_eda.data_store import resolve_data
 
-def train_baseline(df: pd.DataFrame, features: list, target: str = "SalePrice") -> dict:
+def train_baseline(df, features: list, target: str = "SalePrice",
+                   where=None, params: list = None) -> dict:
     """
     Train a baseline Linear Regression model and return evaluation metrics.
     
     Args:
-        df (pd.DataFrame): Housing data
+        df (pd.DataFrame or str): Housing data or path to a SQLite data store
         features (list): List of feature column names
         target (str): Target column name (default: "SalePrice")
+        where (dict or str): Optional row filter, e.g. {"OverallQual": (7, None)};
+            see data_store.query_store
+        params (list): Parameters for a SQL predicate string
         
     Returns:
         dict: Dictionary containing R2, MAE, RMSE, and feature coefficients
@@ -20,15 +25,17 @@ def train_baseline(df: pd.DataFrame, features: list, target: str = "SalePrice")
         ValueError: If no valid features found or data is invalid
         Exception: If training fails
     """
+    if not isinstance(features, list) or len(features) == 0:
+        raise ValueError("Features must be a non-empty list")
+    
+    df = resolve_data(df, columns=features + [target], where=where, params=params)
+    
     if not isinstance(df, pd.DataFrame):
         raise ValueError("Input must be a pandas DataFrame")
     
     if df.empty:
         raise ValueError("Cannot train model on an empty DataFrame")
     
-    if not isinstance(features, list) or len(features) == 0:
-        raise ValueError("Features must be a non-empty list")
-    
     try:
         # Validate features
         valid_features = [f for f in features if f in df.columns]
@@ -0,0 +1,269 @@
+import sqlite3
+import os
+import pandas as pd
+
+# Columns analysts filter on most often; each gets its own index in the store
+INDEXED_COLUMNS = ["Neighborhood", "YrSold", "SalePrice", "OverallQual"]
+
+# Column holding the DataFrame index so queries return the original row labels
+INDEX_COLUMN = "_row_index"
+
+
+def _quote(name: str) -> str:
+    """Quote a column or table name for use in SQLite statements."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_value(value):
+    """Convert numpy scalars to plain Python values that sqlite3 can bind."""
+    return value.item() if hasattr(value, "item") else value
+
+
+def _validate_where(where, params: list, available: list) -> None:
+    """
+    Check a filter specification against the available columns.
+
+    A dict maps column names to conditions:
+    - scalar value: equality, e.g. {"Neighborhood": "NAmes"}
+    - (low, high) tuple: inclusive range, either end may be None,
+      e.g. {"YrSold": (2007, 2009)} or {"SalePrice": (None, 200000)}
+    - list or set: membership, e.g. {"OverallQual": [7, 8, 9]}
+    - None: missing values
+
+    A string is a raw SQL predicate with "?" placeholders filled from params.
+
+    Raises:
+        ValueError: If the filter is malformed or names an unknown column
+    """
+    if params and not isinstance(where, str):
+        raise ValueError("params can only be used with a SQL predicate string")
+
+    if where is None or isinstance(where, str):
+        return
+
+    if not isinstance(where, dict):
+        raise ValueError("where must be a dict of column filters or a SQL predicate string")
+
+    for col, cond in where.items():
+        if col not in available:
+            raise ValueError(f"Filter column '{col}' not found. Available columns: {available}")
+        if isinstance(cond, tuple) and len(cond) != 2:
+            raise ValueError(f"Range filter for '{col}' must be a (low, high) tuple")
+        if isinstance(cond, (list, set)) and not cond:
+            raise ValueError(f"Membership filter for '{col}' must not be empty")
+
+
+def _build_where(where) -> tuple:
+    """
+    Translate a validated filter specification into a SQL WHERE clause.
+
+    Returns:
+        tuple: (clause, params) where clause is "" when there is no filter
+    """
+    if where is None:
+        return "", []
+
+    if isinstance(where, str):
+        return where, []
+
+    clauses = []
+    params = []
+    for col, cond in where.items():
+        qcol = _quote(col)
+        if isinstance(cond, tuple):
+            low, high = cond
+            if low is not None:
+                clauses.append(f"{qcol} >= ?")
+                params.append(_sql_value(low))
+            if high is not None:
+                clauses.append(f"{qcol} <= ?")
+                params.append(_sql_value(high))
+        elif isinstance(cond, (list, set)):
+            values = list(cond)
+            clauses.append(f"{qcol} IN ({', '.join('?' for _ in values)})")
+            params.extend(_sql_value(v) for v in values)
+        elif cond is None:
+            clauses.append(f"{qcol} IS NULL")
+        else:
+            clauses.append(f"{qcol} = ?")
+            params.append(_sql_value(cond))
+
+    return " AND ".join(clauses), params
+
+
+def _build_mask(df: pd.DataFrame, where: dict) -> pd.Series:
+    """Translate a validated dict filter into a boolean row mask for a DataFrame."""
+    mask = pd.Series(True, index=df.index)
+    for col, cond in where.items():
+        if isinstance(cond, tuple):
+            low, high = cond
+            if low is not None:
+                mask &= df[col] >= low
+            if high is not None:
+                mask &= df[col] <= high
+        elif isinstance(cond, (list, set)):
+            mask &= df[col].isin(list(cond))
+        elif cond is None:
+            mask &= df[col].isna()
+        else:
+            mask &= df[col] == cond
+
+    return mask
+
+
+def save_to_store(df: pd.DataFrame, path: str, table: str = "sales") -> None:
+    """
+    Persist processed housing data to a local SQLite store with indexes on
+    the common filter columns (Neighborhood, YrSold, SalePrice, OverallQual).
+
+    Rows are written in DataFrame order and the DataFrame index is kept, so
+    query results match the in-memory row order and labels.
+
+    Args:
+        df (pd.DataFrame): Processed housing data
+        path (str): Path to the SQLite database file
+        table (str): Table name (default: "sales"); replaced if it exists
+
+    Raises:
+        ValueError: If input is not a DataFrame or is empty
+        Exception: If writing the store fails
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("Input must be a pandas DataFrame")
+
+    if df.empty:
+        raise ValueError("Cannot store an empty DataFrame")
+
+    if INDEX_COLUMN in df.columns:
+        raise ValueError(f"Column name '{INDEX_COLUMN}' is reserved by the data store")
+
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            df.to_sql(table, conn, if_exists="replace", index=True, index_label=INDEX_COLUMN)
+
+            indexed = []
+            for col in INDEXED_COLUMNS:
+                if col in df.columns:
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{table}_{col}')} "
+                        f"ON {_quote(table)} ({_quote(col)})"
+                    )
+                    indexed.append(col)
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+
+        print(f"Stored {len(df)} rows in '{table}' at {path} (indexed: {', '.join(indexed) or 'none'})")
+
+    except Exception as e:
+        raise Exception(f"Error saving data to store {path}: {str(e)}")
+
+
+def query_store(path: str, columns: list = None, where=None, params: list = None,
+                table: str = "sales") -> pd.DataFrame:
+    """
+    Load only the matching rows and columns from a SQLite store.
+
+    Rows come back in the order they were stored, labelled with the
+    original DataFrame index.
+
+    Args:
+        path (str): Path to the SQLite database file
+        columns (list): Columns to select; names missing from the store are
+            skipped (default: all columns)
+        where (dict or str): Column filters (see _validate_where) or a SQL
+            predicate string with "?" placeholders
+        params (list): Parameters for a SQL predicate string
+        table (str): Table name (default: "sales")
+
+    Returns:
+        pd.DataFrame: Matching housing data
+
+    Raises:
+        FileNotFoundError: If the store does not exist
+        ValueError: If the filter is invalid or none of the requested columns exist
+        Exception: If the query fails
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Data store not found: {path}")
+
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            stored = [row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")]
+            if not stored:
+                raise ValueError(f"Table '{table}' not found in data store")
+            available = [c for c in stored if c != INDEX_COLUMN]
+
+            _validate_where(where, params, available)
+            clause, where_params = _build_where(where)
+            if isinstance(where, str):
+                where_params = list(params or [])
+
+            # Unknown columns are dropped so callers can report them with their own errors
+            if columns is None:
+                selected = available
+            else:
+                selected = [c for c in dict.fromkeys(columns) if c in available]
+                if not selected:
+                    raise ValueError(f"None of the columns {columns} found. Available columns: {available}")
+
+            select = ", ".join(_quote(c) for c in [INDEX_COLUMN] + selected)
+            sql = f"SELECT {select} FROM {_quote(table)}"
+            if clause:
+                sql += f" WHERE {clause}"
+            sql += " ORDER BY rowid"
+
+            df = pd.read_sql_query(sql, conn, params=where_params, index_col=INDEX_COLUMN)
+            df.index.name = None
+        finally:
+            conn.close()
+
+        print(f"Loaded {len(df)} rows and {len(df.columns)} columns from store {path}")
+        return df
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise Exception(f"Error querying data store {path}: {str(e)}")
+
+
+def resolve_data(data, columns: list = None, where=None, params: list = None) -> pd.DataFrame:
+    """
+    Return a DataFrame for an analysis function from either an in-memory
+    DataFrame or a store path.
+
+    A store path is queried for just the requested columns and the rows
+    matching `where`. A DataFrame is filtered in memory when `where` is a dict,
+    with the same rules and errors as the store.
+
+    Args:
+        data (pd.DataFrame or str): Housing data or path to a SQLite store
+        columns (list): Columns needed by the caller (store queries only)
+        where (dict or str): Row filter (see query_store)
+        params (list): Parameters for a SQL predicate string
+
+    Returns:
+        pd.DataFrame: Housing data to analyse
+
+    Raises:
+        ValueError: If data is neither a DataFrame nor a path, the filter is
+            invalid, or a SQL predicate string is used with a DataFrame
+    """
+    if isinstance(data, (str, os.PathLike)):
+        return query_store(os.fspath(data), columns=columns, where=where, params=params)
+
+    if not isinstance(data, pd.DataFrame):
+        raise ValueError("Input must be a pandas DataFrame or a path to a data store")
+
+    if isinstance(where, str):
+        raise ValueError("SQL predicate strings are only supported when reading from a data store")
+
+    _validate_where(where, params, list(data.columns))
+
+    if where is None:
+        return data
+
+    return data[_build_mask(data, where)]
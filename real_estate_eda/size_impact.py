@@ -1,20 +1,27 @@
 import seaborn as sns
 import matplotlib.pyplot as plt
 import pandas as pd
+from real_estate_eda.data_store import resolve_data
 
-def plot_size_vs_price(df: pd.DataFrame, feature: str, target: str = "SalePrice") -> None:
+def plot_size_vs_price(df, feature: str, target: str = "SalePrice",
+                       where=None, params: list = None) -> None:
     """
     Plot regression plot showing relationship between a size feature and price.
     
     Args:
-        df (pd.DataFrame): Housing data
+        df (pd.DataFrame or str): Housing data or path to a SQLite data store
         feature (str): Feature column name (e.g., "GrLivArea")
         target (str): Target column name (default: "SalePrice")
+        where (dict or str): Optional row filter, e.g. {"YrSold": (2007, 2009)};
+            see data_store.query_store
+        params (list): Parameters for a SQL predicate string
         
     Raises:
         ValueError: If required columns don't exist or aren't numeric
         Exception: If plotting fails
     """
+    df = resolve_data(df, columns=[feature, target], where=where, params=params)
+
     if not isinstance(df, pd.DataFrame):
         raise ValueError("Input must be a pandas DataFrame")
     
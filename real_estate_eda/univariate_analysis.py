@@ -1,19 +1,25 @@
 import seaborn as sns
 import matplotlib.pyplot as plt
 import pandas as pd
+from real_estate_eda.data_store import resolve_data
 
-def plot_distribution(df: pd.DataFrame, column: str) -> None:
+def plot_distribution(df, column: str, where=None, params: list = None) -> None:
     """
     Plot the distribution of a numeric column with histogram and KDE.
     
     Args:
-        df (pd.DataFrame): Housing data
+        df (pd.DataFrame or str): Housing data or path to a SQLite data store
         column (str): Name of the column to plot
+        where (dict or str): Optional row filter, e.g. {"Neighborhood": "NAmes"};
+            see data_store.query_store
+        params (list): Parameters for a SQL predicate string
         
     Raises:
         ValueError: If column doesn't exist or is not numeric
         Exception: If plotting fails
     """
+    df = resolve_data(df, columns=[column], where=where, params=params)
+
     if not isinstance(df, pd.DataFrame):
         raise ValueError("Input must be a pandas DataFrame")
     
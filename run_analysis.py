@@ -2,6 +2,7 @@ import pandas as pd
 from real_estate_eda import data_loading, data_cleaning, feature_engineering
 from real_estate_eda import univariate_analysis, multivariate_analysis
 from real_estate_eda import size_impact, market_trends, clustering, baseline_model
+from real_estate_eda import data_store
 
 df = data_loading.load_data("housing_data.csv")
 df = data_cleaning.clean_data(df)
@@ -15,3 +16,10 @@ market_trends.plot_trends(df)
 df = clustering.cluster_homes(df, ["GrLivArea","BathsTotal","GarageCars","TotalBsmtSF"], target="SalePrice")
 results = baseline_model.train_baseline(df, ["GrLivArea","BathsTotal","GarageCars"], target="SalePrice")
 print(results)
+
+# Persist the processed data so later sessions can query filtered subsets without rebuilding
+data_store.save_to_store(df, "housing_data.db")
+univariate_analysis.plot_distribution("housing_data.db", "SalePrice", where={"Neighborhood": "NAmes"})
+size_impact.plot_size_vs_price("housing_data.db", "GrLivArea", where={"YrSold": (2007, 2009), "OverallQual": (7, None)})
+baseline_model.train_baseline("housing_data.db", ["GrLivArea","BathsTotal","GarageCars"],
+                              where={"SalePrice": (100000, 300000)})
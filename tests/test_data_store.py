@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from real_estate_eda.data_store import resolve_data, save_to_store
+
+COLUMNS = ["Neighborhood", "YrSold", "SalePrice", "OverallQual", "GrLivArea"]
+
+
+@pytest.fixture
+def sales():
+    rng = np.random.default_rng(0)
+    n = 300
+    df = pd.DataFrame({
+        "Neighborhood": rng.choice(["NAmes", "CollgCr", "OldTown", "Edwards"], n),
+        "YrSold": rng.integers(2006, 2011, n),
+        "SalePrice": rng.integers(50000, 400000, n),
+        "OverallQual": rng.integers(1, 11, n),
+        "GrLivArea": rng.integers(500, 4000, n),
+    })
+    # Non-default labels, as left behind by drop_duplicates in clean_data
+    df.index = rng.permutation(np.arange(1000, 1000 + n))
+    return df
+
+
+@pytest.fixture
+def store(sales, tmp_path):
+    path = str(tmp_path / "sales.db")
+    save_to_store(sales, path)
+    return path
+
+
+@pytest.mark.parametrize("where", [
+    None,
+    {"SalePrice": (100000, 300000)},
+    {"Neighborhood": "NAmes", "YrSold": (2007, 2009)},
+    {"OverallQual": [7, 8, 9], "SalePrice": (None, 250000)},
+])
+def test_store_matches_dataframe(sales, store, where):
+    expected = resolve_data(sales, where=where)[COLUMNS]
+    result = resolve_data(store, columns=COLUMNS, where=where)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_store_selects_only_requested_columns(store):
+    result = resolve_data(store, columns=["SalePrice", "Missing"])
+
+    assert list(result.columns) == ["SalePrice"]
+
+
+@pytest.mark.parametrize("where, params", [
+    ({"YrSld": (2009, None)}, None),
+    ({"YrSold": []}, None),
+    ({"SalePrice": (1, 2, 3)}, None),
+    ({"YrSold": 2008}, [2008]),
+])
+def test_invalid_filters_raise_for_both_sources(sales, store, where, params):
+    with pytest.raises(ValueError):
+        resolve_data(sales, where=where, params=params)
+    with pytest.raises(ValueError):
+        resolve_data(store, columns=COLUMNS, where=where, params=params)
+
+
+def test_store_raises_when_no_requested_column_exists(store):
+    with pytest.raises(ValueError, match="None of the columns"):
+        resolve_data(store, columns=["Nope"])